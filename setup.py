@@ -1,4 +1,14 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_namespace_packages
+
+try:
+    # optional compiled fast path, spotifio.utils falls back to pure python without it
+    from Cython.Build import cythonize
+    ext_modules = cythonize(["spotifio/_fastpath.pyx"], language_level=3)
+    # a source install without a c compiler still works, just without the fast path
+    for ext in ext_modules:
+        ext.optional = True
+except ImportError:
+    ext_modules = []
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -12,25 +22,53 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/s4w3d0ff/spotifio",
-    packages=find_packages(),
+    packages=find_namespace_packages(include=["spotifio*"]),
+    package_data={"spotifio": ["py.typed", "_fastpath.pyx"]},
+    ext_modules=ext_modules,
+    include_package_data=True,
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
+        "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: 3.13",
         "Topic :: Software Development :: Libraries :: Python Modules",
         "Framework :: AsyncIO",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.10",
     install_requires=[
-        "aiohttp>=3.8.0",
+        "aiohttp>=3.9.0",
         "aiofiles>=0.8.0",
+        "aiolimiter>=1.1.0",
+        "backoff>=2.2",
     ],
+    extras_require={
+        "speedups": [
+            "aiohttp[speedups]>=3.9.0",
+            "aiodns>=3.0",
+            "charset-normalizer>=3.3",
+            "orjson>=3.9",
+        ],
+        "tokencache": [
+            "aiofile>=3.8; sys_platform=='linux'",
+        ],
+        "distributed": [
+            "redis[hiredis]>=5.0",
+        ],
+        "streaming": [
+            "ijson>=3.1",
+        ],
+        "multiprocess": [
+            "aiomultiprocess>=0.9",
+        ],
+        "performance": [
+            "uvloop>=0.19; platform_system!='Windows'",
+        ],
+    },
     keywords="spotify api async aiohttp music streaming oauth2",
     project_urls={
         "Bug Reports": "https://github.com/s4w3d0ff/spotifio/issues",
@@ -1,3 +1,7 @@
 from .oauth import TokenHandler
+from .exceptions import SpotifyError, SpotifyAPIError, SpotifyAuthError, SpotifyScopeError
 from .storage import JSONStorage
-from .client import Client
\ No newline at end of file
+from .session import get_session, close_session
+from .client import Client
+from .batch import BatchingClient
+from .limiter import RedisConcurrencyLimiter
\ No newline at end of file
@@ -0,0 +1,13 @@
+# cython: language_level=3
+
+cpdef list flatten_items(list pages, str key=None):
+    """ Merges the 'items' of paging objects into one list, picking item[key] when key is given """
+    cdef list out = []
+    cdef dict page
+    for page in pages:
+        if key is None:
+            out.extend(page['items'])
+        else:
+            for item in page['items']:
+                out.append(item[key])
+    return out
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from .client import Client, _cacheable
+
+logger = logging.getLogger(__name__)
+
+
+class Batcher:
+    """ Collects single id lookups and sends them as one multi-id request """
+    def __init__(self, fetch, key, batch_size=50, max_delay_ms=5):
+        self.fetch = fetch
+        self.key = key
+        self.batch_size = batch_size
+        self.max_delay = max_delay_ms / 1000
+        self._queue = None
+        self._task = None
+        self._flushes = set()
+
+    def submit(self, item_id):
+        """ Queues an id, returns a future for its entry in the batched response """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item_id, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def _run(self):
+        """ Drains the queue in batches, exits once it stays empty """
+        while not self._queue.empty():
+            if self._queue.qsize() < self.batch_size:
+                # give other callers a moment to add to this batch
+                await asyncio.sleep(self.max_delay)
+            size = min(self.batch_size, self._queue.qsize())
+            batch = [self._queue.get_nowait() for _ in range(size)]
+            # don't hold up the next batch while this one is in flight
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch):
+        logger.debug(f"Flushing batch of {len(batch)} {self.key}")
+        try:
+            r = await self.fetch([item_id for item_id, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), item in zip(batch, r[self.key]):
+            if not future.done():
+                future.set_result(item)
+
+
+class BatchingClient(Client):
+    """ Client that coalesces concurrent get_track, get_album, get_artist and get_track_audio_features
+    calls into requests to their several_* endpoints """
+    __slots__ = ('_track_batcher', '_album_batcher', '_artist_batcher', '_audio_features_batcher')
+
+    def __init__(self, *args, batch_size=50, max_delay_ms=5, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._track_batcher = Batcher(self.get_several_tracks, 'tracks', batch_size, max_delay_ms)
+        # spotify takes at most 20 album ids per request
+        self._album_batcher = Batcher(self.get_several_albums, 'albums', min(batch_size, 20), max_delay_ms)
+        self._artist_batcher = Batcher(self.get_several_artists, 'artists', batch_size, max_delay_ms)
+        self._audio_features_batcher = Batcher(self.get_several_audio_features, 'audio_features', batch_size, max_delay_ms)
+
+    # batched lookups go through the response cache like Client's, hits never join a batch
+    @_cacheable('get_track')
+    async def get_track(self, track_id, market=None):
+        if market:
+            return await super().get_track(track_id, market)
+        return await self._track_batcher.submit(track_id)
+
+    @_cacheable('get_album')
+    async def get_album(self, album_id, market=None):
+        if market:
+            return await super().get_album(album_id, market)
+        return await self._album_batcher.submit(album_id)
+
+    @_cacheable('get_artist')
+    async def get_artist(self, artist_id):
+        return await self._artist_batcher.submit(artist_id)
+
+    @_cacheable('get_track_audio_features')
+    async def get_track_audio_features(self, track_id):
+        return await self._audio_features_batcher.submit(track_id)
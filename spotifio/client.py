@@ -1,13 +1,147 @@
 import logging
 import aiohttp
 import asyncio
+import contextlib
+import random
+import time
+import functools
+import operator
+import re
+from collections import OrderedDict
+import backoff
+from yarl import URL
+from aiolimiter import AsyncLimiter
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from .oauth import TokenHandler
+from .exceptions import SpotifyAPIError, SpotifyScopeError
+from .session import create_session, create_connector, SESSION_LIMIT, SESSION_DNS_CACHE
+from .utils import json_dumpb, json_loads, flatten_items
 
 logger = logging.getLogger(__name__)
 
-base_url = "https://api.spotify.com/v1"
+# the session joins request paths onto the origin, endpoints are relative to /v1/
+api_origin = "https://api.spotify.com"
+api_prefix = "/v1/"
+
+@functools.lru_cache(maxsize=2048)
+def _api_url(endpoint):
+    """ Parsed request path for an endpoint, the session takes a URL as is instead of parsing the string again """
+    return URL(api_prefix + endpoint)
+
+@functools.lru_cache(maxsize=256)
+def _join_ids(ids):
+    """ Comma joined ids, cached for batches that are sent over and over (eg. polling check_saved_*) """
+    return ','.join(ids)
+
+def _param_value(v):
+    if isinstance(v, str):
+        return v
+    if isinstance(v, bool):
+        return str(v).lower()
+    if hasattr(v, '__iter__'):
+        # any iterable of ids, lists, tuples, sets or generators
+        return _join_ids(tuple(v))
+    return v
+
+def _params(**kwargs):
+    """ Builds query params as a tuple of pairs (aiohttp takes it as is, and it's hashable),
+    drops unset values and comma joins id iterables (strings pass through as is) """
+    return tuple((k, _param_value(v)) for k, v in kwargs.items() if v is not None)
+
+def _compile_scopes(requirements):
+    """ Assigns a bit to every scope, returns the bits and each method's requirement as a mask """
+    bits = {scope: 1 << i for i, scope in enumerate(sorted({s for scopes in requirements.values() for s in scopes}))}
+    return bits, {
+        name: functools.reduce(operator.or_, (bits[s] for s in scopes), 0)
+        for name, scopes in requirements.items()
+    }
+
+_FIELD_GROUP = re.compile(r'\([^()]*\)')
+
+def _require_fields(fields, *required):
+    """ Adds required top level fields to a spotify fields filter, eg. 'items(track(name))' -> 'items(track(name)),total' """
+    top = fields
+    while '(' in top:
+        stripped = _FIELD_GROUP.sub('', top)
+        if stripped == top:  # unbalanced, leave it to spotify to reject
+            break
+        top = stripped
+    present = {name.strip().split('.', 1)[0] for name in top.split(',')}  # 'items.track.name' selects items
+    return ','.join([fields, *(name for name in required if name not in present)])
+
+# transient server side failures worth retrying
+_RETRY_STATUSES = (500, 502, 503, 504)
+# methods that are safe to send again after the server may have acted on them
+_RETRY_METHODS = frozenset(('GET',))
+
+def _cacheable(method_name):
+    """ Serves repeat calls of an idempotent GET endpoint from the handler's response cache.
+    Hits return the cached object itself, callers must not modify it """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            ttl = self.CACHE_TTLS.get(method_name)
+            key = (method_name, args, tuple(sorted(kwargs.items())))
+            try:
+                hit = self._cache.get(key) if ttl and self._cache_size else None
+            except TypeError:  # unhashable arguments, don't cache
+                return await func(self, *args, **kwargs)
+            now = time.monotonic()
+            if hit and hit[0] > now:
+                self._cache.move_to_end(key)
+                return hit[1]
+            result = await func(self, *args, **kwargs)
+            if ttl and self._cache_size:
+                self._cache[key] = (now + ttl, result)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
+class _TokenBucket:
+    """ Adaptive retry budget. Successes deposit a fraction of a token, failures (429/5xx) take
+    a whole one, and the bucket refills slowly on its own. Requests wait while it is below one
+    token, so a burst of failures throttles the client before spotify has to. """
+    def __init__(self, capacity=10, success_deposit=0.1, failure_cost=1.0, refill_rate=0.5):
+        self.capacity = capacity
+        self.success_deposit = success_deposit
+        self.failure_cost = failure_cost
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    async def acquire(self):
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+            self._refill()
+
+    def on_success(self):
+        self._tokens = min(self.capacity, self._tokens + self.success_deposit)
+
+    def on_failure(self):
+        self._refill()
+        self._tokens = max(0, self._tokens - self.failure_cost)
 
 class RequestHandler:
+    __slots__ = (
+        'token_handler', '_limiter', '_rate_limiter', '_max_concurrent', '_sem', '_session',
+        '_connector', '_owns_connector', '_owns_token_handler', '_connection_limit', '_limit_per_host', '_dns_cache_ttl',
+        'max_retries', 'base_backoff', 'max_backoff', '_bucket', '_paused_until', '_cache', '_cache_size', '_inflight',
+        '_token_cache', '_token_expiry', '_token_lock', '_auth_headers', '_scope_mask', '_scopes_key'
+    )
     SCOPE_REQUIREMENTS = {
         ### PLAYER -----------------------------------------
         'get_playback_state': ['user-read-playback-state'],
@@ -111,94 +245,320 @@ class RequestHandler:
         'remove_saved_shows': ['user-library-modify'],
         'check_saved_shows': ['user-library-read']
     }
+    # checks are a single AND against the granted scopes
+    _SCOPE_BITS, SCOPE_REQUIREMENTS = _compile_scopes(SCOPE_REQUIREMENTS)
+    # seconds to keep responses of endpoints decorated with @_cacheable
+    CACHE_TTLS = {
+        'get_track': 3600,
+        'get_album': 3600,
+        'get_artist': 3600,
+        'get_category': 3600,
+        'get_track_audio_features': 86400,
+        'get_track_audio_analysis': 86400,
+        'get_available_genre_seeds': 86400,
+        'get_available_markets': 86400
+    }
 
-    def __init__(self, token_handler=None, *args, **kwargs):
+    def __init__(self, token_handler=None, *args, requests_per_minute=None, max_concurrent=None, limiter=None,
+                 connector=None, connection_limit=SESSION_LIMIT, limit_per_host=10, dns_cache_ttl=SESSION_DNS_CACHE,
+                 max_retries=5, base_backoff=0.5, max_backoff=30, cache_size=4096, **kwargs):
+        # a token handler we build ourselves shares our connection pool
+        self._owns_token_handler = token_handler is None
         self.token_handler = token_handler or TokenHandler(*args, **kwargs)
-
-    async def _check_scope(self, method_name):
-        current_scopes = set(self.token_handler.scope)
-        required_scopes = set(self.SCOPE_REQUIREMENTS.get(method_name, []))
-        missing_scopes = required_scopes - current_scopes
-        if missing_scopes:
-            raise Exception(f"Missing required scopes for {method_name}: {', '.join(missing_scopes)}")
+        # any async context manager entered around each request, eg. RedisConcurrencyLimiter.
+        # entered after the local semaphore so requests queued here don't hold its (shared) slots
+        self._limiter = limiter or contextlib.nullcontext()
+        # leaky bucket limiter, lets short bursts through but holds the average rate
+        self._rate_limiter = AsyncLimiter(requests_per_minute, 60) if requests_per_minute else None
+        # caps in-flight requests, created on first use so it binds to the running loop.
+        # defaults to the per host connection limit, anything above that only queues in the connector
+        self._max_concurrent = max_concurrent or limit_per_host
+        self._sem = None
+        # one session per handler so connections are kept alive between calls
+        self._session = None
+        self._connector = connector
+        self._owns_connector = False
+        self._connection_limit = connection_limit
+        self._limit_per_host = limit_per_host
+        self._dns_cache_ttl = dns_cache_ttl
+        # retries for 429/5xx responses
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._bucket = _TokenBucket()
+        # monotonic time until which a 429's Retry-After holds back every request, not just the one retrying
+        self._paused_until = 0.0
+        # lru of (expiry, response) for cacheable endpoints, 0 disables it
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        # identical GETs in flight share one request (and one result object)
+        self._inflight = {}
+        # access token cached locally, get_token() is only awaited near expiry
+        self._token_cache = None
+        self._token_expiry = 0.0
+        self._token_lock = asyncio.Lock()
+        self._auth_headers = None
+        # bitmask of the handler's scopes, rebuilt only when the scope list changes
+        self._scope_mask = 0
+        self._scopes_key = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    def _get_connector(self):
+        """ The handler's connection pool, built on first use unless one was passed in """
+        if self._connector is None or (self._owns_connector and self._connector.closed):
+            self._connector = create_connector(
+                limit=self._connection_limit,
+                limit_per_host=self._limit_per_host,
+                ttl_dns_cache=self._dns_cache_ttl,
+                keepalive_timeout=75
+            )
+            self._owns_connector = True
+        return self._connector
+
+    def _share_connector(self):
+        """ Points a token handler we built at our connection pool, so token and api requests
+        share one dns cache and set of sockets """
+        if self._owns_token_handler and self.token_handler._connector is None:
+            self.token_handler._connector = self._get_connector()
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            # the connector is shared with the token handler, it's closed by aclose, not with the session
+            self._session = create_session(connector=self._get_connector(), connector_owner=False, base_url=api_origin)
+        return self._session
+
+    async def aclose(self):
+        """ Closes the handler's http session, and the token handler and connection pool if it built them """
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if self._owns_token_handler:
+            await self.token_handler.stop()
+            self.token_handler._connector = None
+        if self._owns_connector and not self._connector.closed:
+            await self._connector.close()
+
+    def _get_semaphore(self):
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self._max_concurrent)
+        return self._sem
+
+    @property
+    def _granted_mask(self):
+        scope = self.token_handler.scope
+        key = (id(scope), len(scope))
+        if key != self._scopes_key:
+            self._scope_mask = functools.reduce(operator.or_, (self._SCOPE_BITS.get(s, 0) for s in scope), 0)
+            self._scopes_key = key
+        return self._scope_mask
+
+    def _check_scope(self, method_name):
+        # most read endpoints need no scope at all, skip the granted mask for them
+        required = self.SCOPE_REQUIREMENTS.get(method_name, 0)
+        if not required:
+            return
+        missing = required & ~self._granted_mask
+        if missing:
+            missing_scopes = [s for s, bit in self._SCOPE_BITS.items() if missing & bit]
+            raise SpotifyScopeError(method_name, missing_scopes)
 
     async def login(self, token=None):
         """ Sets up the token """
+        self._share_connector()
         await self.token_handler._login(token)
     
+    async def _fetch_once(self, method, url, params, data, headers):
+        """ Sends a single request.
+        Returns (status, result), result is the Retry-After delay on a 429 and the error text on a 5xx """
+        session = await self._get_session()
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
+        async with self._get_semaphore(), self._limiter:
+            # checked once a slot is ours, requests queued on the semaphore during a 429 wait too
+            await self._wait_rate_limit()
+            async with session.request(method=method, url=url, params=params, data=data, headers=headers) as resp:
+                # Check if the response status is successful
+                if resp.status == 204:  # No content
+                    return resp.status, None
+                if resp.status == 401:
+                    return resp.status, None
+                if resp.status == 429:
+                    retry_after = resp.headers.get('Retry-After')
+                    return resp.status, int(retry_after) if retry_after else None
+                if not resp.ok:
+                    error_text = await resp.text()
+                    if resp.status in _RETRY_STATUSES:
+                        return resp.status, error_text
+                    raise SpotifyAPIError(resp.status, error_text)
+                body = await resp.read()
+                # some writes answer 200 with an empty body
+                return resp.status, json_loads(body) if body.strip() else None
+
+    # reads are retried with backoff on any connection error or timeout
+    _fetch = backoff.on_exception(
+        backoff.expo,
+        (aiohttp.ClientConnectionError, asyncio.TimeoutError),
+        max_tries=5,
+        jitter=backoff.full_jitter
+    )(_fetch_once)
+    # writes only when connecting failed, the server can't have acted on them yet
+    _fetch_write = backoff.on_exception(
+        backoff.expo,
+        aiohttp.ClientConnectorError,
+        max_tries=5,
+        jitter=backoff.full_jitter
+    )(_fetch_once)
+
+    async def _get_auth_headers(self):
+        """ Returns the cached request headers for the current access token,
+        asks the token handler again when the token is about to expire """
+        if time.monotonic() < self._token_expiry:
+            return self._auth_headers
+        async with self._token_lock:
+            # another caller may have refreshed it while we waited on the lock
+            if time.monotonic() < self._token_expiry:
+                return self._auth_headers
+            self._share_connector()
+            token = await self.token_handler.get_token()
+            self._token_cache = token['access_token']
+            self._auth_headers = {
+                "Authorization": f"Bearer {self._token_cache}",
+                "Content-Type": "application/json"
+            }
+            # expires_time is wall clock, keep a monotonic deadline with a 60s safety margin
+            self._token_expiry = time.monotonic() + token['expires_time'] - time.time() - 60
+            return self._auth_headers
+
+    async def _wait_rate_limit(self):
+        """ Sleeps out the Retry-After of the last 429, and of any that arrive meanwhile """
+        delay = self._paused_until - time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self._paused_until - time.monotonic()
+
+    def _backoff_delay(self, attempt):
+        """ Exponential backoff with full jitter """
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * 2**attempt))
+
     async def _request(self, method, endpoint, params=None, data=None, headers=None):
         """ Base Request Method for Spotify API calls """
-        # Get the current valid token
-        token = await self.token_handler.get_token()
-        # Setup default headers with authorization
-        default_headers = {
-            "Authorization": f"Bearer {token['access_token']}",
-            "Content-Type": "application/json"
-        }
-        # Merge default headers with any additional headers
-        if headers:
-            default_headers.update(headers)
-        # Create the full URL
-        url = f"{base_url}/{endpoint.lstrip('/')}"
-        logger.debug(f"_request({method=}, {url=}, {params=}, {data=})")
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(method=method, url=url, params=params, json=data, headers=default_headers) as resp:
-                    # Check if the response status is successful
-                    if resp.status == 204:  # No content
-                        return None
-                    if resp.status == 401:  # bad token
-                        await self.token_handler._refresh_token()
-                        return await self._request(method, endpoint, params, data, headers)
-                    if resp.status == 429:  # Rate limiting
-                        retry_after = int(resp.headers.get('Retry-After', 1))
-                        logger.warning(f"Rate limited. Waiting {retry_after} seconds")
-                        await asyncio.sleep(retry_after)
-                        return await self._request(method, endpoint, params, data, headers)
-                    if not resp.ok:
-                        error_text = await resp.text()
-                        raise Exception(f"Request failed with status {resp.status}: {error_text}")
-                    return await resp.json()
-        except aiohttp.ClientError as e:
-            logger.error(f"Request failed: {str(e)}")
-            raise Exception(f"Request failed: {str(e)}")
+        if method != 'GET' or headers:
+            return await self._send(method, endpoint, params, data, headers)
+        # _params keeps keyword order, identical calls give identical tuples
+        key = (endpoint, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send(method, endpoint, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield so one cancelled caller doesn't cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _send(self, method, endpoint, params=None, data=None, headers=None):
+        """ Sends the request, refreshing the token on 401 and retrying 429s (and 5xx for reads) """
+        # Create the request path, endpoints are given without a leading slash
+        url = _api_url(endpoint)
+        logger.debug(f"_send({method=}, {url=}, {params=}, {data=})")
+        # encode the json body once, straight to bytes, instead of on every attempt
+        body = json_dumpb(data) if data is not None else None
+        retry_safe = method in _RETRY_METHODS
+        fetch = self._fetch if retry_safe else self._fetch_write
+        for attempt in range(self.max_retries + 1):
+            # Get the headers for the current valid token, merged with any additional headers
+            auth_headers = await self._get_auth_headers()
+            send_headers = {**auth_headers, **headers} if headers else auth_headers
+            # hold off while recent failures have drained the bucket
+            await self._bucket.acquire()
+            status, result = await fetch(method, url, params, body, send_headers)
+            if status == 401:  # bad token
+                self._token_expiry = 0.0
+                await self.token_handler._refresh_token()
+                continue
+            if status not in (429, *_RETRY_STATUSES):
+                self._bucket.on_success()
+                return result
+            self._bucket.on_failure()
+            # a 5xx write may still have been applied, only 429s (rejected outright) are sent again
+            if attempt == self.max_retries or (status != 429 and not retry_safe):
+                break
+            if status == 429 and result is not None:  # Rate limiting
+                delay = result
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            else:
+                delay = self._backoff_delay(attempt)
+            logger.warning(f"Request failed with status {status}. Retrying in {delay:.2f} seconds")
+            await asyncio.sleep(delay)
+        raise SpotifyAPIError(status, result or '')
+
+    async def _stream(self, endpoint, prefix='', params=None):
+        """ Yields (key, value) pairs under prefix as they are parsed off the response body,
+        without buffering the whole body. Errors are raised rather than retried """
+        if ijson is None:
+            raise ImportError("Streaming responses requires ijson: pip install spotifio[streaming]")
+        headers = await self._get_auth_headers()
+        session = await self._get_session()
+        if self._rate_limiter:
+            await self._rate_limiter.acquire()
+        async with self._get_semaphore(), self._limiter:
+            await self._wait_rate_limit()
+            async with session.get(_api_url(endpoint), params=params, headers=headers) as resp:
+                if not resp.ok:
+                    raise SpotifyAPIError(resp.status, await resp.text())
+                async for key, value in ijson.kvitems_async(resp.content, prefix, use_float=True):
+                    yield key, value
+
+    async def _get_many(self, fetch, key, ids, chunk, **kwargs):
+        """ Splits ids into chunks a several_* endpoint accepts, fetches them concurrently
+        (bounded by the request semaphore) and returns the merged list in order """
+        # ids may come pre-joined, as the several_* endpoints accept
+        ids = ids.split(',') if isinstance(ids, str) else list(ids)
+        results = await asyncio.gather(*(fetch(ids[i:i + chunk], **kwargs) for i in range(0, len(ids), chunk)))
+        return [item for r in results for item in r[key]]
+
+    async def _iter_pages(self, fetch, page_size, *args, **kwargs):
+        """ Yields every item of an offset paged endpoint. The first page gives the total,
+        the remaining pages are then fetched concurrently (bounded by the request semaphore) """
+        first = await fetch(*args, limit=page_size, offset=0, **kwargs)
+        for item in first['items']:
+            yield item
+        pages = await asyncio.gather(*(
+            fetch(*args, limit=page_size, offset=offset, **kwargs)
+            for offset in range(page_size, first['total'], page_size)
+        ))
+        for item in flatten_items(pages):
+            yield item
 
 
 
 class Client(RequestHandler):
+    __slots__ = ()
+
     ### PLAYER Methods -----------------------------------------
     async def get_playback_state(self, market=None, additional_types=None):
-        await self._check_scope('get_playback_state')
-        params = {}
-        if market:
-            params['market'] = market
-        if additional_types:
-            params['additional_types'] = ','.join(additional_types)
-        return await self._request('GET', 'me/player', params=params)
+        self._check_scope('get_playback_state')
+        return await self._request('GET', 'me/player', params=_params(market=market, additional_types=additional_types))
 
     async def transfer_playback(self, device_ids, play=None):
-        await self._check_scope('transfer_playback')
+        self._check_scope('transfer_playback')
         data = {'device_ids': device_ids}
         if play is not None:
             data['play'] = play
         await self._request('PUT', 'me/player', data=data)
 
     async def get_available_devices(self):
-        await self._check_scope('get_available_devices')
+        self._check_scope('get_available_devices')
         return await self._request('GET', 'me/player/devices')
 
     async def get_currently_playing(self, market=None, additional_types=None):
-        await self._check_scope('get_currently_playing')
-        params = {}
-        if market:
-            params['market'] = market
-        if additional_types:
-            params['additional_types'] = ','.join(additional_types)
-        return await self._request('GET', 'me/player/currently-playing', params=params)
+        self._check_scope('get_currently_playing')
+        return await self._request('GET', 'me/player/currently-playing', params=_params(market=market, additional_types=additional_types))
 
     async def start_playback(self, device_id=None, context_uri=None, uris=None, offset=None, position_ms=None):
-        await self._check_scope('start_playback')
-        params = {'device_id': device_id} if device_id else {}
+        self._check_scope('start_playback')
         data = {}
         if context_uri:
             data['context_uri'] = context_uri
@@ -208,152 +568,116 @@ class Client(RequestHandler):
             data['offset'] = offset
         if position_ms is not None:
             data['position_ms'] = position_ms
-        await self._request('PUT', 'me/player/play', params=params, data=data)
+        await self._request('PUT', 'me/player/play', params=_params(device_id=device_id), data=data)
 
     async def pause_playback(self, device_id=None):
-        await self._check_scope('pause_playback')
-        params = {'device_id': device_id} if device_id else {}
-        await self._request('PUT', 'me/player/pause', params=params)
+        self._check_scope('pause_playback')
+        await self._request('PUT', 'me/player/pause', params=_params(device_id=device_id))
 
     async def skip_to_next(self, device_id=None):
-        await self._check_scope('skip_to_next')
-        params = {'device_id': device_id} if device_id else {}
-        await self._request('POST', 'me/player/next', params=params)
+        self._check_scope('skip_to_next')
+        await self._request('POST', 'me/player/next', params=_params(device_id=device_id))
 
     async def skip_to_previous(self, device_id=None):
-        await self._check_scope('skip_to_previous')
-        params = {'device_id': device_id} if device_id else {}
-        await self._request('POST', 'me/player/previous', params=params)
+        self._check_scope('skip_to_previous')
+        await self._request('POST', 'me/player/previous', params=_params(device_id=device_id))
 
     async def seek_to_position(self, position_ms, device_id=None):
-        await self._check_scope('seek_to_position')
-        params = {'position_ms': position_ms}
-        if device_id:
-            params['device_id'] = device_id
-        await self._request('PUT', 'me/player/seek', params=params)
+        self._check_scope('seek_to_position')
+        await self._request('PUT', 'me/player/seek', params=_params(position_ms=position_ms, device_id=device_id))
 
     async def set_repeat_mode(self, state, device_id=None):
-        await self._check_scope('set_repeat_mode')
-        params = {'state': state}
-        if device_id:
-            params['device_id'] = device_id
-        await self._request('PUT', 'me/player/repeat', params=params)
+        self._check_scope('set_repeat_mode')
+        await self._request('PUT', 'me/player/repeat', params=_params(state=state, device_id=device_id))
 
     async def set_playback_volume(self, volume_percent, device_id=None):
-        await self._check_scope('set_playback_volume')
-        params = {'volume_percent': volume_percent}
-        if device_id:
-            params['device_id'] = device_id
-        await self._request('PUT', 'me/player/volume', params=params)
+        self._check_scope('set_playback_volume')
+        await self._request('PUT', 'me/player/volume', params=_params(volume_percent=volume_percent, device_id=device_id))
 
     async def set_shuffle(self, state, device_id=None):
-        await self._check_scope('set_shuffle')
-        params = {'state': str(state).lower()}
-        if device_id:
-            params['device_id'] = device_id
-        await self._request('PUT', 'me/player/shuffle', params=params)
+        self._check_scope('set_shuffle')
+        await self._request('PUT', 'me/player/shuffle', params=_params(state=state, device_id=device_id))
 
     async def get_recently_played(self, limit=20, after=None, before=None):
-        await self._check_scope('get_recently_played')
-        params = {'limit': limit}
-        if after:
-            params['after'] = after
-        if before:
-            params['before'] = before
-        return await self._request('GET', 'me/player/recently-played', params=params)
+        self._check_scope('get_recently_played')
+        return await self._request('GET', 'me/player/recently-played', params=_params(limit=limit, after=after, before=before))
 
     async def add_to_queue(self, uri, device_id=None):
-        await self._check_scope('add_to_queue')
-        params = {'uri': uri}
-        if device_id:
-            params['device_id'] = device_id
-        await self._request('POST', 'me/player/queue', params=params)
+        self._check_scope('add_to_queue')
+        await self._request('POST', 'me/player/queue', params=_params(uri=uri, device_id=device_id))
 
     async def get_queue(self):
-        await self._check_scope('get_queue')
+        self._check_scope('get_queue')
         return await self._request('GET', 'me/player/queue')
 
     ### USERS Methods -----------------------------------------
     async def get_current_user(self):
-        await self._check_scope('get_current_user')
+        self._check_scope('get_current_user')
         return await self._request('GET', 'me')
 
     async def get_user_profile(self, user_id):
-        await self._check_scope('get_user_profile')
+        self._check_scope('get_user_profile')
         return await self._request('GET', f'users/{user_id}')
 
     async def get_followed_artists(self, after=None, limit=20):
-        await self._check_scope('get_followed_artists')
-        params = {
-            'type': 'artist',
-            'limit': limit
-        }
-        if after:
-            params['after'] = after
-        return await self._request('GET', 'me/following', params=params)
+        self._check_scope('get_followed_artists')
+        return await self._request('GET', 'me/following', params=_params(type='artist', limit=limit, after=after))
+
+    async def iter_followed_artists(self, page_size=50):
+        """ Yields all followed artists, cursor paged so pages are fetched one after another """
+        after = None
+        while True:
+            page = (await self.get_followed_artists(after=after, limit=page_size))['artists']
+            for artist in page['items']:
+                yield artist
+            after = page['cursors'].get('after') if page.get('cursors') else None
+            if not page['next'] or not after:
+                break
 
     async def follow_artists(self, ids):
-        await self._check_scope('follow_artists')
-        return await self._request('PUT', 'me/following', params={'type': 'artist'}, data={'ids': ids})
+        self._check_scope('follow_artists')
+        return await self._request('PUT', 'me/following', params=_params(type='artist'), data={'ids': ids})
 
     async def follow_users(self, ids):
-        await self._check_scope('follow_users')
-        return await self._request('PUT', 'me/following', params={'type': 'user'}, data={'ids': ids})
+        self._check_scope('follow_users')
+        return await self._request('PUT', 'me/following', params=_params(type='user'), data={'ids': ids})
 
     async def unfollow_artists(self, ids):
-        await self._check_scope('unfollow_artists')
-        return await self._request('DELETE', 'me/following', params={'type': 'artist'}, data={'ids': ids})
+        self._check_scope('unfollow_artists')
+        return await self._request('DELETE', 'me/following', params=_params(type='artist'), data={'ids': ids})
 
     async def unfollow_users(self, ids):
-        await self._check_scope('unfollow_users')
-        return await self._request('DELETE', 'me/following', params={'type': 'user'}, data={'ids': ids})
+        self._check_scope('unfollow_users')
+        return await self._request('DELETE', 'me/following', params=_params(type='user'), data={'ids': ids})
 
     async def check_following_artists(self, ids):
-        await self._check_scope('check_following_artists')
-        params = {
-            'type': 'artist',
-            'ids': ','.join(ids)
-        }
-        return await self._request('GET', 'me/following/contains', params=params)
+        self._check_scope('check_following_artists')
+        return await self._request('GET', 'me/following/contains', params=_params(type='artist', ids=ids))
 
     async def check_following_users(self, ids):
-        await self._check_scope('check_following_users')
-        params = {
-            'type': 'user',
-            'ids': ','.join(ids)
-        }
-        return await self._request('GET', 'me/following/contains', params=params)
+        self._check_scope('check_following_users')
+        return await self._request('GET', 'me/following/contains', params=_params(type='user', ids=ids))
 
     async def follow_playlist(self, playlist_id, public=True):
-        await self._check_scope('follow_playlist')
+        self._check_scope('follow_playlist')
         data = {'public': public}
         return await self._request('PUT', f'playlists/{playlist_id}/followers', data=data)
 
     async def unfollow_playlist(self, playlist_id):
-        await self._check_scope('unfollow_playlist')
+        self._check_scope('unfollow_playlist')
         return await self._request('DELETE', f'playlists/{playlist_id}/followers')
 
     async def get_user_top_items(self, type, limit=20, offset=0, time_range='medium_term'):
-        await self._check_scope('get_user_top_items')
-        params = {
-            'limit': limit,
-            'offset': offset,
-            'time_range': time_range
-        }
-        return await self._request('GET', f'me/top/{type}', params=params)
+        self._check_scope('get_user_top_items')
+        return await self._request('GET', f'me/top/{type}', params=_params(limit=limit, offset=offset, time_range=time_range))
 
     ### PLAYLIST Methods -----------------------------------
     async def get_playlist(self, playlist_id, market=None, fields=None):
-        await self._check_scope('get_playlist')
-        params = {}
-        if market:
-            params['market'] = market
-        if fields:
-            params['fields'] = fields
-        return await self._request('GET', f'playlists/{playlist_id}', params=params)
+        self._check_scope('get_playlist')
+        return await self._request('GET', f'playlists/{playlist_id}', params=_params(market=market, fields=fields))
 
     async def change_playlist_details(self, playlist_id, name=None, public=None, collaborative=None, description=None):
-        await self._check_scope('change_playlist_details')
+        self._check_scope('change_playlist_details')
         data = {}
         if name is not None:
             data['name'] = name
@@ -366,52 +690,46 @@ class Client(RequestHandler):
         return await self._request('PUT', f'playlists/{playlist_id}', data=data)
 
     async def get_playlist_tracks(self, playlist_id, market=None, fields=None, limit=20, offset=0):
-        await self._check_scope('get_playlist_tracks')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
+        self._check_scope('get_playlist_tracks')
+        return await self._request('GET', f'playlists/{playlist_id}/tracks', params=_params(limit=limit, offset=offset, market=market, fields=fields))
+
+    async def iter_playlist_tracks(self, playlist_id, market=None, fields=None, page_size=100):
+        """ Yields all tracks of a playlist """
         if fields:
-            params['fields'] = fields
-        return await self._request('GET', f'playlists/{playlist_id}/tracks', params=params)
+            # paging needs these whatever the caller filters for
+            fields = _require_fields(fields, 'items', 'total')
+        async for item in self._iter_pages(self.get_playlist_tracks, page_size, playlist_id, market=market, fields=fields):
+            yield item
 
     async def add_playlist_tracks(self, playlist_id, uris, position=None):
-        await self._check_scope('add_playlist_tracks')
-        params = {'uris': uris if isinstance(uris, str) else ','.join(uris)}
-        if position is not None:
-            params['position'] = position
-        return await self._request('POST', f'playlists/{playlist_id}/tracks', params=params)
+        self._check_scope('add_playlist_tracks')
+        return await self._request('POST', f'playlists/{playlist_id}/tracks', params=_params(uris=uris, position=position))
 
     async def update_playlist_tracks(self, playlist_id, uris):
-        await self._check_scope('update_playlist_tracks')
+        self._check_scope('update_playlist_tracks')
         data = {'uris': uris if isinstance(uris, list) else [uris]}
         return await self._request('PUT', f'playlists/{playlist_id}/tracks', data=data)
 
     async def remove_playlist_tracks(self, playlist_id, tracks):
-        await self._check_scope('remove_playlist_tracks')
+        self._check_scope('remove_playlist_tracks')
         data = {'tracks': tracks}
         return await self._request('DELETE', f'playlists/{playlist_id}/tracks', data=data)
 
     async def get_current_user_playlists(self, limit=20, offset=0):
-        await self._check_scope('get_current_user_playlists')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        return await self._request('GET', 'me/playlists', params=params)
+        self._check_scope('get_current_user_playlists')
+        return await self._request('GET', 'me/playlists', params=_params(limit=limit, offset=offset))
+
+    async def iter_current_user_playlists(self, page_size=50):
+        """ Yields all playlists of the current user """
+        async for item in self._iter_pages(self.get_current_user_playlists, page_size):
+            yield item
 
     async def get_user_playlists(self, user_id, limit=20, offset=0):
-        await self._check_scope('get_user_playlists')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        return await self._request('GET', f'users/{user_id}/playlists', params=params)
+        self._check_scope('get_user_playlists')
+        return await self._request('GET', f'users/{user_id}/playlists', params=_params(limit=limit, offset=offset))
 
     async def create_playlist(self, user_id, name, public=True, collaborative=False, description=None):
-        await self._check_scope('create_playlist')
+        self._check_scope('create_playlist')
         data = {
             'name': name,
             'public': public,
@@ -422,356 +740,259 @@ class Client(RequestHandler):
         return await self._request('POST', f'users/{user_id}/playlists', data=data)
 
     async def get_featured_playlists(self, locale=None, country=None, limit=20, offset=0):
-        await self._check_scope('get_featured_playlists')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if locale:
-            params['locale'] = locale
-        if country:
-            params['country'] = country
-        return await self._request('GET', 'browse/featured-playlists', params=params)
+        self._check_scope('get_featured_playlists')
+        return await self._request('GET', 'browse/featured-playlists', params=_params(limit=limit, offset=offset, locale=locale, country=country))
 
     async def get_category_playlists(self, category_id, country=None, limit=20, offset=0):
-        await self._check_scope('get_category_playlists')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if country:
-            params['country'] = country
-        return await self._request('GET', f'browse/categories/{category_id}/playlists', params=params)
+        self._check_scope('get_category_playlists')
+        return await self._request('GET', f'browse/categories/{category_id}/playlists', params=_params(limit=limit, offset=offset, country=country))
 
     ### SEARCH Methods ------------------------------------
     async def search(self, q, types, market=None, limit=20, offset=0, include_external=None):
-        await self._check_scope('search')
-        params = {
-            'q': q,
-            'type': ','.join(types) if isinstance(types, list) else types,
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        if include_external:
-            params['include_external'] = include_external
-        return await self._request('GET', 'search', params=params)
+        self._check_scope('search')
+        return await self._request('GET', 'search', params=_params(q=q, type=types, limit=limit, offset=offset, market=market, include_external=include_external))
 
     ### TRACKS Methods -----------------------------------
+    @_cacheable('get_track')
     async def get_track(self, track_id, market=None):
-        await self._check_scope('get_track')
-        params = {}
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'tracks/{track_id}', params=params)
+        self._check_scope('get_track')
+        return await self._request('GET', f'tracks/{track_id}', params=_params(market=market))
 
     async def get_several_tracks(self, track_ids, market=None):
-        await self._check_scope('get_several_tracks')
-        params = {'ids': ','.join(track_ids)}
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'tracks', params=params)
+        self._check_scope('get_several_tracks')
+        return await self._request('GET', 'tracks', params=_params(ids=track_ids, market=market))
 
     async def get_user_saved_tracks(self, market=None, limit=20, offset=0):
-        await self._check_scope('get_user_saved_tracks')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'me/tracks', params=params)
+        self._check_scope('get_user_saved_tracks')
+        return await self._request('GET', 'me/tracks', params=_params(limit=limit, offset=offset, market=market))
+
+    async def iter_user_saved_tracks(self, market=None, page_size=50):
+        """ Yields all saved tracks of the current user """
+        async for item in self._iter_pages(self.get_user_saved_tracks, page_size, market=market):
+            yield item
 
     async def save_tracks(self, track_ids):
-        await self._check_scope('save_tracks')
+        self._check_scope('save_tracks')
         return await self._request('PUT', 'me/tracks', data={'ids': track_ids})
 
     async def remove_saved_tracks(self, track_ids):
-        await self._check_scope('remove_saved_tracks')
+        self._check_scope('remove_saved_tracks')
         return await self._request('DELETE', 'me/tracks', data={'ids': track_ids})
 
     async def check_saved_tracks(self, track_ids):
-        await self._check_scope('check_saved_tracks')
-        params = {'ids': ','.join(track_ids)}
-        return await self._request('GET', 'me/tracks/contains', params=params)
+        self._check_scope('check_saved_tracks')
+        return await self._request('GET', 'me/tracks/contains', params=_params(ids=track_ids))
 
+    @_cacheable('get_track_audio_features')
     async def get_track_audio_features(self, track_id):
-        await self._check_scope('get_track_audio_features')
+        self._check_scope('get_track_audio_features')
         return await self._request('GET', f'audio-features/{track_id}')
 
     async def get_several_audio_features(self, track_ids):
-        await self._check_scope('get_several_audio_features')
-        params = {'ids': ','.join(track_ids)}
-        return await self._request('GET', 'audio-features', params=params)
+        self._check_scope('get_several_audio_features')
+        return await self._request('GET', 'audio-features', params=_params(ids=track_ids))
 
+    @_cacheable('get_track_audio_analysis')
     async def get_track_audio_analysis(self, track_id):
-        await self._check_scope('get_track_audio_analysis')
+        self._check_scope('get_track_audio_analysis')
         return await self._request('GET', f'audio-analysis/{track_id}')
 
+    async def stream_track_audio_analysis(self, track_id):
+        """ Yields the top level sections of a track's audio analysis ('meta', 'track', 'bars', ...)
+        as (name, value) pairs while the body is still downloading, needs spotifio[streaming] """
+        self._check_scope('get_track_audio_analysis')
+        async for section in self._stream(f'audio-analysis/{track_id}'):
+            yield section
+
 
     ### ALBUMS Methods ------------------------------------
+    @_cacheable('get_album')
     async def get_album(self, album_id, market=None):
-        await self._check_scope('get_album')
-        params = {}
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'albums/{album_id}', params=params)
+        self._check_scope('get_album')
+        return await self._request('GET', f'albums/{album_id}', params=_params(market=market))
 
     async def get_several_albums(self, album_ids, market=None):
-        await self._check_scope('get_several_albums')
-        params = {'ids': ','.join(album_ids)}
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'albums', params=params)
+        self._check_scope('get_several_albums')
+        return await self._request('GET', 'albums', params=_params(ids=album_ids, market=market))
 
     async def get_album_tracks(self, album_id, market=None, limit=20, offset=0):
-        await self._check_scope('get_album_tracks')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'albums/{album_id}/tracks', params=params)
+        self._check_scope('get_album_tracks')
+        return await self._request('GET', f'albums/{album_id}/tracks', params=_params(limit=limit, offset=offset, market=market))
+
+    async def iter_album_tracks(self, album_id, market=None, page_size=50):
+        """ Yields all tracks of an album """
+        async for item in self._iter_pages(self.get_album_tracks, page_size, album_id, market=market):
+            yield item
 
     async def get_user_saved_albums(self, limit=20, offset=0, market=None):
-        await self._check_scope('get_user_saved_albums')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'me/albums', params=params)
+        self._check_scope('get_user_saved_albums')
+        return await self._request('GET', 'me/albums', params=_params(limit=limit, offset=offset, market=market))
+
+    async def iter_user_saved_albums(self, market=None, page_size=50):
+        """ Yields all saved albums of the current user """
+        async for item in self._iter_pages(self.get_user_saved_albums, page_size, market=market):
+            yield item
 
     async def save_albums(self, album_ids):
-        await self._check_scope('save_albums')
+        self._check_scope('save_albums')
         return await self._request('PUT', 'me/albums', data={'ids': album_ids})
 
     async def remove_saved_albums(self, album_ids):
-        await self._check_scope('remove_saved_albums')
+        self._check_scope('remove_saved_albums')
         return await self._request('DELETE', 'me/albums', data={'ids': album_ids})
 
     async def check_saved_albums(self, album_ids):
-        await self._check_scope('check_saved_albums')
-        params = {'ids': ','.join(album_ids)}
-        return await self._request('GET', 'me/albums/contains', params=params)
+        self._check_scope('check_saved_albums')
+        return await self._request('GET', 'me/albums/contains', params=_params(ids=album_ids))
 
     async def get_new_releases(self, country=None, limit=20, offset=0):
-        await self._check_scope('get_new_releases')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if country:
-            params['country'] = country
-        return await self._request('GET', 'browse/new-releases', params=params)
+        self._check_scope('get_new_releases')
+        return await self._request('GET', 'browse/new-releases', params=_params(limit=limit, offset=offset, country=country))
 
     ### ARTISTS Methods ----------------------------------
+    @_cacheable('get_artist')
     async def get_artist(self, artist_id):
-        await self._check_scope('get_artist')
+        self._check_scope('get_artist')
         return await self._request('GET', f'artists/{artist_id}')
 
     async def get_several_artists(self, artist_ids):
-        await self._check_scope('get_several_artists')
-        params = {'ids': ','.join(artist_ids)}
-        return await self._request('GET', 'artists', params=params)
+        self._check_scope('get_several_artists')
+        return await self._request('GET', 'artists', params=_params(ids=artist_ids))
 
     async def get_artist_albums(self, artist_id, include_groups=None, market=None, limit=20, offset=0):
-        await self._check_scope('get_artist_albums')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if include_groups:
-            params['include_groups'] = ','.join(include_groups)
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'artists/{artist_id}/albums', params=params)
+        self._check_scope('get_artist_albums')
+        return await self._request('GET', f'artists/{artist_id}/albums', params=_params(limit=limit, offset=offset, include_groups=include_groups, market=market))
 
     async def get_artist_top_tracks(self, artist_id, market):
-        await self._check_scope('get_artist_top_tracks')
-        params = {'market': market}
-        return await self._request('GET', f'artists/{artist_id}/top-tracks', params=params)
+        self._check_scope('get_artist_top_tracks')
+        return await self._request('GET', f'artists/{artist_id}/top-tracks', params=_params(market=market))
 
     async def get_artist_related_artists(self, artist_id):
-        await self._check_scope('get_artist_related_artists')
+        self._check_scope('get_artist_related_artists')
         return await self._request('GET', f'artists/{artist_id}/related-artists')
 
     ### AUDIOBOOKS Methods -------------------------------
     async def get_audiobook(self, audiobook_id, market=None):
-        await self._check_scope('get_audiobook')
-        params = {}
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'audiobooks/{audiobook_id}', params=params)
+        self._check_scope('get_audiobook')
+        return await self._request('GET', f'audiobooks/{audiobook_id}', params=_params(market=market))
 
     async def get_several_audiobooks(self, audiobook_ids, market=None):
-        await self._check_scope('get_several_audiobooks')
-        params = {'ids': ','.join(audiobook_ids)}
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'audiobooks', params=params)
+        self._check_scope('get_several_audiobooks')
+        return await self._request('GET', 'audiobooks', params=_params(ids=audiobook_ids, market=market))
 
     async def get_audiobook_chapters(self, audiobook_id, market=None, limit=20, offset=0):
-        await self._check_scope('get_audiobook_chapters')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'audiobooks/{audiobook_id}/chapters', params=params)
+        self._check_scope('get_audiobook_chapters')
+        return await self._request('GET', f'audiobooks/{audiobook_id}/chapters', params=_params(limit=limit, offset=offset, market=market))
 
     async def get_user_saved_audiobooks(self, limit=20, offset=0):
-        await self._check_scope('get_user_saved_audiobooks')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        return await self._request('GET', 'me/audiobooks', params=params)
+        self._check_scope('get_user_saved_audiobooks')
+        return await self._request('GET', 'me/audiobooks', params=_params(limit=limit, offset=offset))
 
     async def save_audiobooks(self, audiobook_ids):
-        await self._check_scope('save_audiobooks')
+        self._check_scope('save_audiobooks')
         return await self._request('PUT', 'me/audiobooks', data={'ids': audiobook_ids})
 
     async def remove_saved_audiobooks(self, audiobook_ids):
-        await self._check_scope('remove_saved_audiobooks')
+        self._check_scope('remove_saved_audiobooks')
         return await self._request('DELETE', 'me/audiobooks', data={'ids': audiobook_ids})
 
     async def check_saved_audiobooks(self, audiobook_ids):
-        await self._check_scope('check_saved_audiobooks')
-        params = {'ids': ','.join(audiobook_ids)}
-        return await self._request('GET', 'me/audiobooks/contains', params=params)
+        self._check_scope('check_saved_audiobooks')
+        return await self._request('GET', 'me/audiobooks/contains', params=_params(ids=audiobook_ids))
 
     ### CATEGORIES Methods ------------------------------------
     async def get_categories(self, country=None, locale=None, limit=20, offset=0):
-        await self._check_scope('get_categories')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if country:
-            params['country'] = country
-        if locale:
-            params['locale'] = locale
-        return await self._request('GET', 'browse/categories', params=params)
+        self._check_scope('get_categories')
+        return await self._request('GET', 'browse/categories', params=_params(limit=limit, offset=offset, country=country, locale=locale))
 
+    @_cacheable('get_category')
     async def get_category(self, category_id, country=None, locale=None):
-        await self._check_scope('get_category')
-        params = {}
-        if country:
-            params['country'] = country
-        if locale:
-            params['locale'] = locale
-        return await self._request('GET', f'browse/categories/{category_id}', params=params)
+        self._check_scope('get_category')
+        return await self._request('GET', f'browse/categories/{category_id}', params=_params(country=country, locale=locale))
 
     ### CHAPTERS Methods ------------------------------------
     async def get_chapter(self, chapter_id, market=None):
-        await self._check_scope('get_chapter')
-        params = {}
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'chapters/{chapter_id}', params=params)
+        self._check_scope('get_chapter')
+        return await self._request('GET', f'chapters/{chapter_id}', params=_params(market=market))
 
     async def get_several_chapters(self, chapter_ids, market=None):
-        await self._check_scope('get_several_chapters')
-        params = {'ids': ','.join(chapter_ids)}
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'chapters', params=params)
+        self._check_scope('get_several_chapters')
+        return await self._request('GET', 'chapters', params=_params(ids=chapter_ids, market=market))
+
+    async def get_many_chapters(self, chapter_ids, market=None, chunk=50):
+        """ Like get_several_chapters without the 50 id limit, returns a list of chapters """
+        return await self._get_many(self.get_several_chapters, 'chapters', chapter_ids, chunk, market=market)
 
     ### EPISODES Methods ------------------------------------
     async def get_episode(self, episode_id, market=None):
-        await self._check_scope('get_episode')
-        params = {}
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'episodes/{episode_id}', params=params)
+        self._check_scope('get_episode')
+        return await self._request('GET', f'episodes/{episode_id}', params=_params(market=market))
 
     async def get_several_episodes(self, episode_ids, market=None):
-        await self._check_scope('get_several_episodes')
-        params = {'ids': ','.join(episode_ids)}
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'episodes', params=params)
+        self._check_scope('get_several_episodes')
+        return await self._request('GET', 'episodes', params=_params(ids=episode_ids, market=market))
+
+    async def get_many_episodes(self, episode_ids, market=None, chunk=50):
+        """ Like get_several_episodes without the 50 id limit, returns a list of episodes """
+        return await self._get_many(self.get_several_episodes, 'episodes', episode_ids, chunk, market=market)
 
     async def get_user_saved_episodes(self, market=None, limit=20, offset=0):
-        await self._check_scope('get_user_saved_episodes')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'me/episodes', params=params)
+        self._check_scope('get_user_saved_episodes')
+        return await self._request('GET', 'me/episodes', params=_params(limit=limit, offset=offset, market=market))
 
     async def save_episodes(self, episode_ids):
-        await self._check_scope('save_episodes')
+        self._check_scope('save_episodes')
         return await self._request('PUT', 'me/episodes', data={'ids': episode_ids})
 
     async def remove_saved_episodes(self, episode_ids):
-        await self._check_scope('remove_saved_episodes')
+        self._check_scope('remove_saved_episodes')
         return await self._request('DELETE', 'me/episodes', data={'ids': episode_ids})
 
     async def check_saved_episodes(self, episode_ids):
-        await self._check_scope('check_saved_episodes')
-        params = {'ids': ','.join(episode_ids)}
-        return await self._request('GET', 'me/episodes/contains', params=params)
+        self._check_scope('check_saved_episodes')
+        return await self._request('GET', 'me/episodes/contains', params=_params(ids=episode_ids))
 
     ### GENRES Methods ------------------------------------
+    @_cacheable('get_available_genre_seeds')
     async def get_available_genre_seeds(self):
-        await self._check_scope('get_available_genre_seeds')
+        self._check_scope('get_available_genre_seeds')
         return await self._request('GET', 'recommendations/available-genre-seeds')
 
     ### MARKETS Methods ------------------------------------
+    @_cacheable('get_available_markets')
     async def get_available_markets(self):
-        await self._check_scope('get_available_markets')
+        self._check_scope('get_available_markets')
         return await self._request('GET', 'markets')
 
     ### SHOWS Methods ------------------------------------
     async def get_show(self, show_id, market=None):
-        await self._check_scope('get_show')
-        params = {}
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'shows/{show_id}', params=params)
+        self._check_scope('get_show')
+        return await self._request('GET', f'shows/{show_id}', params=_params(market=market))
 
     async def get_several_shows(self, show_ids, market=None):
-        await self._check_scope('get_several_shows')
-        params = {'ids': ','.join(show_ids)}
-        if market:
-            params['market'] = market
-        return await self._request('GET', 'shows', params=params)
+        self._check_scope('get_several_shows')
+        return await self._request('GET', 'shows', params=_params(ids=show_ids, market=market))
+
+    async def get_many_shows(self, show_ids, market=None, chunk=50):
+        """ Like get_several_shows without the 50 id limit, returns a list of shows """
+        return await self._get_many(self.get_several_shows, 'shows', show_ids, chunk, market=market)
 
     async def get_show_episodes(self, show_id, market=None, limit=20, offset=0):
-        await self._check_scope('get_show_episodes')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        if market:
-            params['market'] = market
-        return await self._request('GET', f'shows/{show_id}/episodes', params=params)
+        self._check_scope('get_show_episodes')
+        return await self._request('GET', f'shows/{show_id}/episodes', params=_params(limit=limit, offset=offset, market=market))
 
     async def get_user_saved_shows(self, limit=20, offset=0):
-        await self._check_scope('get_user_saved_shows')
-        params = {
-            'limit': limit,
-            'offset': offset
-        }
-        return await self._request('GET', 'me/shows', params=params)
+        self._check_scope('get_user_saved_shows')
+        return await self._request('GET', 'me/shows', params=_params(limit=limit, offset=offset))
 
     async def save_shows(self, show_ids):
-        await self._check_scope('save_shows')
+        self._check_scope('save_shows')
         return await self._request('PUT', 'me/shows', data={'ids': show_ids})
 
     async def remove_saved_shows(self, show_ids):
-        await self._check_scope('remove_saved_shows')
+        self._check_scope('remove_saved_shows')
         return await self._request('DELETE', 'me/shows', data={'ids': show_ids})
 
     async def check_saved_shows(self, show_ids):
-        await self._check_scope('check_saved_shows')
-        params = {'ids': ','.join(show_ids)}
-        return await self._request('GET', 'me/shows/contains', params=params)
\ No newline at end of file
+        self._check_scope('check_saved_shows')
+        return await self._request('GET', 'me/shows/contains', params=_params(ids=show_ids))
\ No newline at end of file
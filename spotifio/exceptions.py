@@ -0,0 +1,21 @@
+class SpotifyError(Exception):
+    """ Base class for errors raised by spotifio """
+
+
+class SpotifyAPIError(SpotifyError):
+    """ Spotify answered with an error status """
+    def __init__(self, status, text):
+        super().__init__(f"Request failed with status {status}: {text}")
+        self.status = status
+        self.text = text
+
+
+class SpotifyAuthError(SpotifyAPIError):
+    """ The accounts service refused a token request """
+
+
+class SpotifyScopeError(SpotifyError):
+    """ The token lacks scopes the endpoint requires """
+    def __init__(self, method_name, missing_scopes):
+        super().__init__(f"Missing required scopes for {method_name}: {', '.join(missing_scopes)}")
+        self.missing_scopes = missing_scopes
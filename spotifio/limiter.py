@@ -0,0 +1,55 @@
+import os
+import time
+import asyncio
+import contextvars
+
+try:
+    from redis import asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+# drop slots older than the window (crashed workers), then take one if any are free
+_ACQUIRE_SCRIPT = """
+local now = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[2]))
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('EXPIRE', KEYS[1], ARGV[5])
+    return 1
+end
+return 0
+"""
+
+# ids of the slots held in the current context, innermost last. a stream holds its slot across
+# yields, so requests made inside it nest their own acquire/release on top of it
+_request_ids = contextvars.ContextVar('spotifio_limiter_request_ids', default=())
+
+
+class RedisConcurrencyLimiter:
+    """ Caps in-flight Spotify requests across every process sharing one redis """
+    def __init__(self, redis=None, url='redis://localhost:6379', key='spotifio:inflight',
+                 max_concurrent=10, window=60, poll_interval=0.05):
+        if redis is None:
+            if aioredis is None:
+                raise ImportError("RedisConcurrencyLimiter requires redis: pip install spotifio[distributed]")
+            redis = aioredis.from_url(url)
+        self.redis = redis
+        self.key = key
+        self.max_concurrent = max_concurrent
+        self.window = window
+        self.poll_interval = poll_interval
+        self._acquire = redis.register_script(_ACQUIRE_SCRIPT)
+
+    async def __aenter__(self):
+        request_id = os.urandom(4).hex()
+        while not await self._acquire(
+            keys=[self.key],
+            args=[time.time(), self.window, self.max_concurrent, request_id, self.window*2]
+        ):
+            await asyncio.sleep(self.poll_interval)
+        _request_ids.set(_request_ids.get() + (request_id,))
+
+    async def __aexit__(self, *exc):
+        request_ids = _request_ids.get()
+        _request_ids.set(request_ids[:-1])
+        await self.redis.zrem(self.key, request_ids[-1])
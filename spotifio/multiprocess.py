@@ -0,0 +1,38 @@
+import asyncio
+import contextvars
+import logging
+from multiprocessing import util
+from .client import Client
+
+logger = logging.getLogger(__name__)
+
+_worker_client = contextvars.ContextVar('spotifio_worker_client', default=None)
+
+
+def worker_init(client_kwargs, client_class=Client):
+    """ aiomultiprocess Pool initializer, builds one Client (and so one connection pool) per worker process.
+    The client is closed when the worker process exits """
+    logger.debug(f"Creating worker {client_class.__name__}...")
+    client = client_class(**client_kwargs)
+    _worker_client.set(client)
+    # aiomultiprocess sets the worker's loop before calling the initializer and leaves it open after
+    # the worker's run returns. multiprocessing runs finalizers with an exitpriority when the worker
+    # exits cleanly (fork or spawn, after pool.close() and join()), so the session, connector and any
+    # pending token save are closed/flushed there. A terminated worker skips them
+    loop = asyncio.get_event_loop()
+    util.Finalize(None, _close_client, args=(loop, client), exitpriority=10)
+
+
+def _close_client(loop, client):
+    if loop.is_closed():
+        logger.warning(f"Worker loop closed before its {type(client).__name__} could be closed")
+        return
+    loop.run_until_complete(client.aclose())
+
+
+def worker_client():
+    """ Returns the Client created by worker_init for the current worker """
+    client = _worker_client.get()
+    if client is None:
+        raise RuntimeError("worker_client() needs a Pool started with initializer=worker_init")
+    return client
@@ -1,13 +1,15 @@
-import aiohttp
 import asyncio
 import webbrowser
-import os
+import secrets
 import base64
 import logging
+import functools
 import time
 from aiohttp import web
 from urllib.parse import urlparse, urlencode
 from .storage import JSONStorage
+from .session import create_session, create_connector
+from .exceptions import SpotifyAuthError
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,9 @@ closeBrowser = """
     </body>
 </html>
 """
+# the callback responses never change, encode them once
+_CLOSE_BROWSER_BYTES = closeBrowser.encode('utf-8')
+_STATE_MISMATCH_BYTES = b"State mismatch. Authorization failed."
 
 class WebServer:
     def __init__(self, host, port):
@@ -54,52 +59,73 @@ class WebServer:
         self._app_task = None
 
 
+@functools.lru_cache(maxsize=128)
+def _basic_auth(client_id, client_secret):
+    """ Basic auth header value for the client credentials """
+    return f"Basic {base64.b64encode(f'{client_id}:{client_secret}'.encode()).decode()}"
+
+
 class TokenHandler:
-    def __init__(self, client_id, client_secret, redirect_uri=None, scope=[], storage=None, *args, **kwargs):
+    def __init__(self, client_id, client_secret, redirect_uri=None, scope=None, storage=None, *args,
+                 connector=None, connection_limit=64, keepalive_timeout=75, **kwargs):
         self.client_id = client_id
         self.redirect_uri = redirect_uri or "http://localhost:8888/callback"
-        self.scope = scope
+        # read only, a tuple so handlers never share one mutable default list
+        self.scope = tuple(scope) if scope else ()
         self.storage = storage or JSONStorage(*args, **kwargs)
-        self._state = os.urandom(14).hex()
+        # everything but the state is fixed per handler, build the query once
+        auth_params = {
+            'client_id': self.client_id,
+            'response_type': 'code',
+            'redirect_uri': self.redirect_uri,
+        }
+        if self.scope:
+            auth_params['scope'] = ' '.join(self.scope)
+        self._auth_url_base = f"https://accounts.spotify.com/authorize?{urlencode(auth_params)}"
+        self._state = secrets.token_urlsafe(16)
         self._auth_code = None
         self._auth_future = None
         self._token = None
         self._token_url = "https://accounts.spotify.com/api/token"
         self._token_headers = {
-            "Authorization": f"Basic {base64.b64encode(f'{self.client_id}:{client_secret}'.encode()).decode()}",
+            "Authorization": _basic_auth(self.client_id, client_secret),
             "Content-Type": "application/x-www-form-urlencoded"
         }
+        # kept alive between refreshes, created on first use
+        self._session = None
+        self._connector = connector
+        self._connection_limit = connection_limit
+        self._keepalive_timeout = keepalive_timeout
         parsed_uri = urlparse(self.redirect_uri)
         self.server = WebServer(parsed_uri.hostname, parsed_uri.port)
         self.server.add_route(f"/{parsed_uri.path.lstrip('/')}", self._callback_handler)
         # refresh token handler stuff
         self._refresh_event = asyncio.Event()
         self._refresh_task = None
+        self._refresh_handle = None
         self._running = False
+        # token saves run in the background, stop() waits for the last one
+        self._save_task = None
+        # concurrent refreshes share one token request, concurrent logins wait on the first
+        self._refreshing = None
+        self._login_lock = asyncio.Lock()
         
     async def _callback_handler(self, request):
         if request.query.get('state') != self._state:
-            return web.Response(text="State mismatch. Authorization failed.", status=400)
+            return web.Response(body=_STATE_MISMATCH_BYTES, status=400, content_type='text/plain', charset='utf-8')
         if 'error' in request.query:
             return web.Response(text=f"Authorization failed: {request.query['error']}", status=400)
         self._auth_code = request.query.get('code')
         if self._auth_code and not self._auth_future.done():
             self._auth_future.set_result(self._auth_code)
-        return web.Response(text=closeBrowser, content_type='text/html', charset='utf-8')
+        return web.Response(body=_CLOSE_BROWSER_BYTES, content_type='text/html', charset='utf-8')
 
     async def _get_auth_code(self):
         logger.warning(f"Opening browser to get Oauth code...")
         await self.server.start()
         self._auth_future = asyncio.Future()
-        params = {
-            'client_id': self.client_id,
-            'response_type': 'code',
-            'redirect_uri': self.redirect_uri,
-            'state': self._state,
-        }
-        if self.scope:
-            params['scope'] = ' '.join(self.scope)
-        auth_link = f"https://accounts.spotify.com/authorize?{urlencode(params)}"
+        # token_urlsafe state needs no escaping
+        auth_link = f"{self._auth_url_base}&state={self._state}"
         try:
             # open webbrowser with auth link
             webbrowser.open(auth_link)
@@ -112,25 +138,66 @@ class TokenHandler:
         await self.server.stop()
         logger.warning(f"Got Oauth code!")
 
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            if self._connector:
+                # caller owns the connector, don't close it with our session
+                self._session = create_session(connector=self._connector, connector_owner=False, headers=self._token_headers)
+            else:
+                # every request goes to the one accounts host
+                self._session = create_session(connector=create_connector(
+                    limit=self._connection_limit,
+                    limit_per_host=self._connection_limit,
+                    keepalive_timeout=self._keepalive_timeout
+                ), headers=self._token_headers)
+        return self._session
+
     async def _token_request(self, data):
         """ Base token request method, used for new or refreshing tokens """
         if self._token:
             # temp store refresh token (spotify doesnt always send one)
             r_token = self._token['refresh_token'] 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self._token_url, headers=self._token_headers, data=data) as resp:
-                if resp.status != 200:
-                    raise Exception(f"Token request failed: {await resp.text()}")
-                self._token = await resp.json()
-                if "refresh_token" not in self._token:
-                    self._token['refresh_token'] = r_token 
-                self._token["expires_time"] = time.time()+int(self._token['expires_in'])
-                await self.storage.save_token(self._token, name="spotify")
-                return self._token
+        session = await self._get_session()
+        async with session.post(self._token_url, data=data) as resp:
+            if resp.status != 200:
+                raise SpotifyAuthError(resp.status, await resp.text())
+            self._token = await resp.json()
+            if "refresh_token" not in self._token:
+                self._token['refresh_token'] = r_token 
+            self._token["expires_time"] = time.time()+int(self._token['expires_in'])
+            # don't hold up waiting get_token callers on the disk write
+            self._save_task = asyncio.ensure_future(self._save_token(self._token, self._save_task))
+            self._save_task.add_done_callback(self._save_done)
+            if self._running:
+                self._schedule_refresh()
+            return self._token
+
+    async def _save_token(self, token, previous):
+        """ Saves the token once the previous save is done, so an older token never lands last """
+        if previous and not previous.done():
+            await asyncio.wait([previous])
+        await self.storage.save_token(token, name="spotify")
+
+    def _save_done(self, task):
+        if not task.cancelled() and task.exception():
+            logger.error(f"Saving token failed! {task.exception()}")
 
     async def _refresh_token(self):
+        """ Refresh oauth token, callers arriving while a refresh is in flight wait on that one """
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._do_refresh())
+            self._refreshing.add_done_callback(self._refresh_done)
+        # shield so a cancelled caller doesn't cancel the refresh for the others
+        return await asyncio.shield(self._refreshing)
+
+    def _refresh_done(self, future):
+        self._refreshing = None
+
+    async def _do_refresh(self):
         """ Refresh oauth token, get new token if refresh fails """
         logger.warning(f"Refreshing token...")
+        # pause 'self.get_token' while the token is replaced
+        self._refresh_event.clear()
         try:
             return await self._token_request({
                 "grant_type": "refresh_token",
@@ -139,6 +206,8 @@ class TokenHandler:
         except Exception as e:
             logger.error(f"Refreshing token failed! {e}")
             return await self._get_new_token()
+        finally:
+            self._refresh_event.set()
 
     async def _get_new_token(self):
         """ Get a new oauth token using the oauth code, get code if we dont have one yet """
@@ -150,50 +219,62 @@ class TokenHandler:
             "redirect_uri": self.redirect_uri
         })
 
-    async def _token_refresher(self):
-        """ Waits for the time to refresh the token and refreshes """
-        self._running = True
-        self._refresh_event.set()
-        logger.debug(f"_token_refresher started...")
-        while self._running:
-            time_left = self._token['expires_time'] - time.time()-60
-            logger.debug(f"Token expires in {time_left} seconds...")
-            if time_left <= 0:
-                # pause 'self.get_token'
-                self._refresh_event.clear()
-                # refresh token
-                await self._refresh_token()
-                # resume 'self.get_token'
-                self._refresh_event.set()
-                continue # skip sleep to get new time_left
-            await asyncio.sleep(time_left)
+    def _schedule_refresh(self):
+        """ (Re)arms the timer that refreshes the token a minute before it expires """
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+        time_left = max(0, self._token['expires_time'] - time.time()-60)
+        logger.debug(f"Token expires in {time_left} seconds...")
+        self._refresh_handle = asyncio.get_running_loop().call_later(time_left, self._on_refresh_timer)
+
+    def _on_refresh_timer(self):
+        self._refresh_handle = None
+        self._refresh_task = asyncio.ensure_future(self._refresh_token())
 
     async def _run(self):
-        self._refresh_task = None
-        self._refresh_task = asyncio.create_task(self._token_refresher())
+        """ Starts refreshing the token on a timer, no task stays alive in between """
+        self._running = True
+        self._refresh_event.set()
+        self._schedule_refresh()
 
     async def stop(self):
         self._running = False
-        try:
-            await asyncio.wait_for(self._refresh_task, timeout=15)
-        except TimeoutError:
-            logger.warning('The task was cancelled due to a timeout')
+        if self._refresh_handle:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if self._refresh_task and not self._refresh_task.done():
+            try:
+                await asyncio.wait_for(self._refresh_task, timeout=15)
+            except TimeoutError:
+                logger.warning('The task was cancelled due to a timeout')
+        if self._save_task and not self._save_task.done():
+            # flush the last token to storage before shutting down, saves are chained so this waits for all of them
+            await asyncio.wait([self._save_task])
+        if self._session and not self._session.closed:
+            await self._session.close()
 
     async def _login(self, token=None):
         """ Checks storage for saved token, gets new token if one isnt found. Starts the token refresher task."""
-        logger.debug(f"Attempting to load saved token...")
-        self._token = await self.storage.load_token(name="spotify")
-        if self._token:
-            logger.warning(f"Loaded saved token from storage!")
-        else:
-            self._token = await self._get_new_token()
-        if not self._running:
-            await self._run()
+        async with self._login_lock:
+            # another caller may have logged in while we waited on the lock
+            if not self._token:
+                logger.debug(f"Attempting to load saved token...")
+                self._token = await self.storage.load_token(name="spotify")
+                if self._token:
+                    logger.warning(f"Loaded saved token from storage!")
+                else:
+                    self._token = await self._get_new_token()
+            if not self._running:
+                await self._run()
 
     async def get_token(self):
         """ Returns current token after checking if the token needs to be refreshed """
         if not self._token:
             await self._login()
+        token = self._token
+        # common case, no refresh in flight and the token isn't about to expire
+        if self._refresh_event.is_set() and token['expires_time'] - time.time() > 60:
+            return token
         # wait for refresh if needed
         await self._refresh_event.wait()
         return self._token
\ No newline at end of file
@@ -0,0 +1,47 @@
+import os
+import aiohttp
+import logging
+from .utils import json_dumps
+
+logger = logging.getLogger(__name__)
+
+# total connection pool size, tunable from the environment
+SESSION_LIMIT = int(os.environ.get('AIOHTTP_SESSION_LIMIT', 500))
+# seconds to keep resolved api/accounts hosts in the connector's dns cache
+SESSION_DNS_CACHE = int(os.environ.get('AIOHTTP_SESSION_DNS_CACHE', 300))
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=10)
+
+_session = None
+
+def create_connector(**kwargs):
+    """ Creates a keep-alive TCPConnector with dns caching """
+    kwargs.setdefault('limit', SESSION_LIMIT)
+    kwargs.setdefault('use_dns_cache', True)
+    kwargs.setdefault('limit_per_host', 10)
+    kwargs.setdefault('ttl_dns_cache', SESSION_DNS_CACHE)
+    kwargs.setdefault('enable_cleanup_closed', True)
+    return aiohttp.TCPConnector(**kwargs)
+
+def create_session(connector=None, **kwargs):
+    """ Creates a new ClientSession, with a default keep-alive connector if none is given """
+    connector = connector or create_connector()
+    kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+    kwargs.setdefault('json_serialize', json_dumps)
+    # spotify only serves utf-8 json, skip charset sniffing when a response omits it
+    kwargs.setdefault('fallback_charset_resolver', lambda resp, body: 'utf-8')
+    return aiohttp.ClientSession(connector=connector, **kwargs)
+
+async def get_session():
+    """ Returns the shared ClientSession, creating it on first use """
+    global _session
+    if _session is None or _session.closed:
+        logger.debug(f"Creating shared ClientSession...")
+        _session = create_session()
+    return _session
+
+async def close_session():
+    """ Closes the shared ClientSession """
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -1,8 +1,16 @@
 import os
-import json
+import asyncio
+import tempfile
 import aiofiles
 from abc import ABC, abstractmethod
 import logging
+from .utils import json_dumpb, json_loads
+
+try:
+    # kernel-async file io (linux aio/io_uring via caio), no thread pool hop
+    from aiofile import async_open
+except ImportError:
+    async_open = aiofiles.open
 
 logger = logging.getLogger(__name__)
 
@@ -27,29 +35,67 @@ class FakeStorage(TokenStorage):
 class JSONStorage(TokenStorage):
     def __init__(self, storage_dir='db'):
         self.storage_dir = storage_dir
+        # token file path per name, joined once
+        self._paths = {}
+        # last token saved/loaded per name, loads after the first don't touch the disk
+        self._tokens = {}
+        # the dir is only needed to save, it's created off the loop on the first save
+        self._dir_ready = False
+
+    def _make_dir(self):
         if not os.path.exists(self.storage_dir):
-            os.makedirs(self.storage_dir)
+            os.makedirs(self.storage_dir, exist_ok=True)
             logger.warning(f"Created dir {self.storage_dir}")
 
     async def _load(self, filename):
-        async with aiofiles.open(filename, 'r') as file:
-            content = await file.read()
-            return json.loads(content)
+        # read raw bytes and parse them directly, no decoded str copy of the file
+        async with async_open(filename, 'rb') as file:
+            return json_loads(await file.read())
+
+    def _write_file(self, data, filename):
+        # written to a temp file and renamed over the old one, a crash mid write can't leave a torn token.
+        # the temp name is unique so overlapping saves (other tasks or worker processes) never share one
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(filename) or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.write(data)
+            os.replace(tmp, filename)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except FileNotFoundError:
+                pass
+            raise
 
     async def _save(self, data, filename):
-        async with aiofiles.open(filename, 'w') as file:
-            await file.write(json.dumps(data, indent=4))
+        # compact bytes, the file is only ever read back by _load.
+        # temp file creation, write, rename and cleanup all run in one thread hop, off the loop
+        await asyncio.to_thread(self._write_file, json_dumpb(data), filename)
+
+    def _path(self, name):
+        path = self._paths.get(name)
+        if path is None:
+            path = self._paths[name] = os.path.join(self.storage_dir, name+"_token.json")
+        return path
 
     async def save_token(self, token, name=''):
         """ Saves OAuth token to database"""
-        file_path = os.path.join(self.storage_dir, name+"_token.json")
+        file_path = self._path(name)
+        if not self._dir_ready:
+            await asyncio.to_thread(self._make_dir)
+            self._dir_ready = True
         await self._save(token, file_path)
+        self._tokens[name] = token
         logger.warning(f"Token saved at: {file_path}")
 
     async def load_token(self, name=''):
         """ Gets saved OAuth token from database"""
-        file_path = os.path.join(self.storage_dir, name+"_token.json")
-        if not os.path.exists(file_path):
+        if name in self._tokens:
+            return self._tokens[name]
+        file_path = self._path(name)
+        try:
+            token = self._tokens[name] = await self._load(file_path)
+            return token
+        except FileNotFoundError:
             logger.warning(f"No token at: {file_path}")
-            return None
-        return await self._load(file_path)
\ No newline at end of file
+            return None
\ No newline at end of file
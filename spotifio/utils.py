@@ -0,0 +1,30 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson:
+    def json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    json_dumpb = orjson.dumps
+    json_loads = orjson.loads
+else:
+    def json_dumpb(obj):
+        return json.dumps(obj).encode()
+
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+
+try:
+    from ._fastpath import flatten_items
+except ImportError:
+    def flatten_items(pages, key=None):
+        """ Merges the 'items' of paging objects into one list, picking item[key] when key is given """
+        if key is None:
+            return [item for page in pages for item in page['items']]
+        return [item[key] for page in pages for item in page['items']]